@@ -6,6 +6,10 @@ Bindings, Connectors, and Capability completeness across multiple Declarations.
 
 from __future__ import annotations
 
+import functools
+import re
+from collections import defaultdict
+
 from tml_engine.models.declaration import Declaration
 from tml_engine.models.graph import (
     AutomationCandidate,
@@ -13,8 +17,8 @@ from tml_engine.models.graph import (
     Dependency,
     OrganizationalGraph,
 )
-from tml_engine.models.identity import ConfirmationStatus
-from tml_engine.models.primitives import Capability, Scope
+from tml_engine.models.identity import CONFIRMED_STATUSES
+from tml_engine.models.primitives import Capability, Connector, Scope
 
 
 def compute_organizational_graph(
@@ -53,57 +57,114 @@ def _trace_decision_flows(declarations: list[Declaration]) -> list[DecisionFlow]
     """
     flows: list[DecisionFlow] = []
 
+    # Index Connectors by normalized source so each distinct (target, source)
+    # pair is compared once, however many Bindings and Connectors share it.
+    # Declarations without an Archetype can never receive a flow, so their
+    # Connectors are left out of the index entirely.
+    readers: list[tuple[Declaration, Connector, str]] = []
+    reader_index: dict[str, list[int]] = defaultdict(list)
+    for decl in declarations:
+        to_arch_id = _find_archetype(decl)
+        if not to_arch_id:
+            continue
+        for connector in decl.connectors:
+            reader_index[_normalize_target(connector.reads_from)].append(len(readers))
+            readers.append((decl, connector, to_arch_id))
+    if not readers:
+        return flows
+    matches_by_target: dict[str, list[int]] = {}
+    # Lowercase each Capability name once rather than on every nearest-capability lookup
+    capability_names = {id(decl): _capability_names(decl) for decl in declarations}
+    # The downstream capability depends only on the Connector; resolve it once
+    # no matter how many Bindings feed into that Connector
+    to_cap_ids: dict[int, str] = {}
+
     # Match bindings to connectors across all declarations
     for decl_a in declarations:
+        from_arch_id = _find_archetype(decl_a)
+        if not from_arch_id:
+            continue
+
         for binding in decl_a.bindings:
-            for decl_b in declarations:
-                for connector in decl_b.connectors:
-                    if not _targets_match(binding.writes_to, connector.reads_from):
-                        continue
-
-                    from_arch_id = _find_archetype(decl_a)
-                    to_arch_id = _find_archetype(decl_b)
-                    if not from_arch_id or not to_arch_id:
-                        continue
-
-                    from_cap_id = _find_capability_near(decl_a, binding.writes_to)
-                    to_cap_id = _find_capability_near(decl_b, connector.reads_from)
-
-                    flows.append(
-                        DecisionFlow(
-                            from_archetype_id=from_arch_id,
-                            from_capability_id=from_cap_id or "",
-                            to_archetype_id=to_arch_id,
-                            to_capability_id=to_cap_id or "",
-                            via_binding_id=binding.id,
-                            via_connector_id=connector.id,
-                            description=(
-                                f"{binding.name} → {connector.name}: {binding.description}"
-                            ),
-                        )
+            written = _normalize_target(binding.writes_to)
+            matched = matches_by_target.get(written)
+            if matched is None:
+                matched = matches_by_target[written] = _match_readers(written, reader_index)
+            from_cap_id = None
+
+            for reader in matched:
+                decl_b, connector, to_arch_id = readers[reader]
+
+                if from_cap_id is None:
+                    from_cap_id = (
+                        _find_capability_near(capability_names[id(decl_a)], binding.writes_to) or ""
+                    )
+                to_cap_id = to_cap_ids.get(reader)
+                if to_cap_id is None:
+                    to_cap_id = to_cap_ids[reader] = (
+                        _find_capability_near(capability_names[id(decl_b)], connector.reads_from)
+                        or ""
                     )
 
+                flows.append(
+                    DecisionFlow(
+                        from_archetype_id=from_arch_id,
+                        from_capability_id=from_cap_id,
+                        to_archetype_id=to_arch_id,
+                        to_capability_id=to_cap_id,
+                        via_binding_id=binding.id,
+                        via_connector_id=connector.id,
+                        description=f"{binding.name} → {connector.name}: {binding.description}",
+                    )
+                )
+
     return flows
 
 
+def _normalize_target(target: str) -> str:
+    return target.lower().strip()
+
+
 def _targets_match(writes_to: str, reads_from: str) -> bool:
     """Check if a Binding target matches a Connector source."""
-    w = writes_to.lower().strip()
-    r = reads_from.lower().strip()
-    return w == r or w in r or r in w
+    return _normalized_targets_match(_normalize_target(writes_to), _normalize_target(reads_from))
+
+
+def _normalized_targets_match(written: str, read: str) -> bool:
+    return written == read or written in read or read in written
+
+
+def _match_readers(written: str, reader_index: dict[str, list[int]]) -> list[int]:
+    """Return indices of Connectors whose normalized source matches a Binding target.
+
+    Exact matches come straight from the index; only the remaining distinct
+    sources are checked for substring containment. Indices are returned in
+    Connector order so flows are emitted in a stable order.
+    """
+    matched = list(reader_index.get(written, ()))
+    for read, indices in reader_index.items():
+        if read != written and _normalized_targets_match(written, read):
+            matched.extend(indices)
+    matched.sort()
+    return matched
 
 
 def _find_archetype(decl: Declaration) -> str | None:
     return decl.archetypes[0].id if decl.archetypes else None
 
 
-def _find_capability_near(decl: Declaration, target: str) -> str | None:
+def _capability_names(decl: Declaration) -> list[tuple[str, str]]:
+    """Return (lowercased name, id) for each Capability, in declaration order."""
+    return [(cap.name.lower(), cap.id) for cap in decl.capabilities]
+
+
+def _find_capability_near(capability_names: list[tuple[str, str]], target: str) -> str | None:
     """Find a capability related to the target string by name matching."""
     target_lower = target.lower()
-    for cap in decl.capabilities:
-        if target_lower in cap.name.lower() or cap.name.lower() in target_lower:
-            return cap.id
-    return decl.capabilities[0].id if decl.capabilities else None
+    for name, cap_id in capability_names:
+        if target_lower in name or name in target_lower:
+            return cap_id
+    return capability_names[0][1] if capability_names else None
 
 
 def _derive_dependencies(flows: list[DecisionFlow]) -> list[Dependency]:
@@ -144,15 +205,25 @@ _BLOCKING_KEYWORDS = {
 _GATING_KEYWORDS = {"gates", "approves", "approval", "authorize", "gating", "review"}
 
 
+def _keyword_pattern(keywords: set[str]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive alternation (substring semantics)."""
+    return re.compile("|".join(re.escape(kw) for kw in sorted(keywords)), re.IGNORECASE)
+
+
+_BLOCKING_RE = _keyword_pattern(_BLOCKING_KEYWORDS)
+_GATING_RE = _keyword_pattern(_GATING_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=4096)
 def _classify_dependency(description: str) -> str:
-    """Classify a dependency type based on description keywords."""
-    lower = description.lower()
-    for kw in _BLOCKING_KEYWORDS:
-        if kw in lower:
-            return "blocking"
-    for kw in _GATING_KEYWORDS:
-        if kw in lower:
-            return "gating"
+    """Classify a dependency type based on description keywords.
+
+    Blocking keywords take precedence over gating keywords wherever they appear.
+    """
+    if _BLOCKING_RE.search(description):
+        return "blocking"
+    if _GATING_RE.search(description):
+        return "gating"
     return "informing"
 
 
@@ -199,58 +270,56 @@ def _score_automation_candidates(
     return candidates
 
 
+_AUTOMATABLE_SKILL_TYPES = frozenset({"agent_skill", "tool", "workflow"})
+
+# One row per readiness check, in scoring order: (weight, missing element, rationale)
+_SCORING_CHECKS: tuple[tuple[float, str, str], ...] = (
+    (0.2, "Decision factors with weights", "{} weighted decision factors"),
+    (0.2, "Heuristics (rules of thumb)", "{} heuristics"),
+    (0.15, "Exception rules", "{} exception rules documented"),
+    (0.2, "Automatable skills (agent_skill, tool, or workflow)", "{} automatable skills"),
+    (0.1, "Anti-patterns", "{} anti-patterns documented"),
+    (0.15, "Human confirmation", "Confirmed by human"),
+)
+
+
 def _score_capability(cap: Capability) -> tuple[float, list[str], list[str]]:
     """Score a single capability. Returns (score, missing_elements, rationale_parts)."""
-    score = 0.0
-    missing: list[str] = []
-    rationale: list[str] = []
-
-    # Decision factors with weights (+0.2)
-    weighted_factors = [f for f in cap.decision_factors if f.weight]
-    if weighted_factors:
-        score += 0.2
-        rationale.append(f"{len(weighted_factors)} weighted decision factors")
-    else:
-        missing.append("Decision factors with weights")
-
-    # Heuristics (+0.2)
-    if cap.heuristics:
-        score += 0.2
-        rationale.append(f"{len(cap.heuristics)} heuristics")
-    else:
-        missing.append("Heuristics (rules of thumb)")
-
-    # Exceptions (+0.15)
-    if cap.exceptions:
-        score += 0.15
-        rationale.append(f"{len(cap.exceptions)} exception rules documented")
-    else:
-        missing.append("Exception rules")
-
-    # Automatable skills (+0.2)
-    automatable_types = {"agent_skill", "tool", "workflow"}
-    automatable_skills = [s for s in cap.skills if s.skill_type in automatable_types]
-    if automatable_skills:
-        score += 0.2
-        rationale.append(f"{len(automatable_skills)} automatable skills")
-    else:
-        missing.append("Automatable skills (agent_skill, tool, or workflow)")
-
-    # Anti-patterns (+0.1)
-    if cap.anti_patterns:
-        score += 0.1
-        rationale.append(f"{len(cap.anti_patterns)} anti-patterns documented")
-    else:
-        missing.append("Anti-patterns")
-
-    # Confirmation status (+0.15)
-    if cap.confirmation and cap.confirmation.status in (
-        ConfirmationStatus.CONFIRMED,
-        ConfirmationStatus.CORRECTED,
-    ):
-        score += 0.15
-        rationale.append("Confirmed by human")
-    else:
-        missing.append("Human confirmation")
-
+    score, missing, rationale = _score_capability_signature(
+        sum(1 for f in cap.decision_factors if f.weight),
+        len(cap.heuristics),
+        len(cap.exceptions),
+        sum(1 for s in cap.skills if s.skill_type in _AUTOMATABLE_SKILL_TYPES),
+        len(cap.anti_patterns),
+        cap.confirmation is not None and cap.confirmation.status in CONFIRMED_STATUSES,
+    )
+    return score, list(missing), list(rationale)
+
+
+@functools.lru_cache(maxsize=8192)
+def _score_capability_signature(
+    weighted_factors: int,
+    heuristics: int,
+    exceptions: int,
+    automatable_skills: int,
+    anti_patterns: int,
+    confirmed: bool,
+) -> tuple[float, tuple[str, ...], tuple[str, ...]]:
+    """Score a capability from the counts that determine its readiness.
+
+    Cached on those counts — recomputing a graph re-scores mostly unchanged
+    capabilities. Returns tuples so cached results cannot be mutated by callers.
+    """
+    counts = (
+        weighted_factors,
+        heuristics,
+        exceptions,
+        automatable_skills,
+        anti_patterns,
+        confirmed,
+    )
+    checks = tuple(zip(_SCORING_CHECKS, counts, strict=True))
+    score = sum((weight for (weight, _, _), count in checks if count), 0.0)
+    missing = tuple(element for (_, element, _), count in checks if not count)
+    rationale = tuple(template.format(count) for (_, _, template), count in checks if count)
     return score, missing, rationale
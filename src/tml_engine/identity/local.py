@@ -6,10 +6,16 @@ creating minimal identities when no stored record exists.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Sequence
+
 from tml_engine.identity.base import IdentityProvider
 from tml_engine.models.identity import HumanIdentity
 from tml_engine.storage.sqlite import StorageEngine
 
+# Separators between name parts in the local part of an email (jane.doe, jane_doe)
+_NAME_SEPARATORS = re.compile(r"[._]+")
+
 
 class LocalIdentityProvider(IdentityProvider):
     """Resolves identities from the local SQLite database."""
@@ -20,28 +26,39 @@ class LocalIdentityProvider(IdentityProvider):
     async def resolve(self, email: str) -> HumanIdentity:
         row = await self._storage.get_identity_by_email(email)
         if row:
-            return HumanIdentity(
-                email=row["email"],
-                display_name=row["display_name"],
-                title=row.get("title"),
-                department=row.get("department"),
-                workspace_id=row.get("workspace_id"),
-            )
-        # Create minimal identity from email
-        local_part = email.split("@")[0]
-        display_name = local_part.replace(".", " ").replace("_", " ").title()
-        return HumanIdentity(email=email, display_name=display_name)
+            return _identity_from_row(row)
+        return _minimal_identity(email)
+
+    async def resolve_many(self, emails: Sequence[str]) -> list[HumanIdentity]:
+        """Resolve several emails with one batched storage lookup.
+
+        Returns identities in the same order as ``emails``, creating minimal
+        identities for any that are not stored.
+        """
+        rows = await self._storage.get_identities_by_emails(emails)
+        return [
+            _identity_from_row(rows[email]) if email in rows else _minimal_identity(email)
+            for email in emails
+        ]
 
     async def list_available(self) -> list[HumanIdentity]:
         cursor = await self._storage.db.execute("SELECT * FROM identities ORDER BY display_name")
         rows = await cursor.fetchall()
-        return [
-            HumanIdentity(
-                email=row["email"],
-                display_name=row["display_name"],
-                title=row["title"],
-                department=row["department"],
-                workspace_id=row["workspace_id"],
-            )
-            for row in rows
-        ]
+        return [_identity_from_row(dict(row)) for row in rows]
+
+
+def _identity_from_row(row: dict) -> HumanIdentity:
+    return HumanIdentity(
+        email=row["email"],
+        display_name=row["display_name"],
+        title=row.get("title"),
+        department=row.get("department"),
+        workspace_id=row.get("workspace_id"),
+    )
+
+
+def _minimal_identity(email: str) -> HumanIdentity:
+    """Create a minimal identity, deriving a display name from the email."""
+    local_part = email.split("@", 1)[0]
+    display_name = " ".join(filter(None, _NAME_SEPARATORS.split(local_part))).title()
+    return HumanIdentity(email=email, display_name=display_name)
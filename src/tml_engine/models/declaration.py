@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterator
 from datetime import datetime
 
 from pydantic import BaseModel
 
-from tml_engine.models.identity import ConfirmationStatus
+from tml_engine.models.identity import CONFIRMED_STATUSES, ConfirmationStatus
 from tml_engine.models.primitives import (
     Archetype,
     Binding,
@@ -39,45 +41,49 @@ class Declaration(BaseModel):
     last_confirmed_at: datetime | None = None
     completion_percentage: float = 0.0
 
-    def _confirmable_primitives(self) -> list:
-        """Return all primitives that have a confirmation field."""
-        primitives: list = []
-        primitives.append(self.scope)
-        primitives.extend(self.archetypes)
-        primitives.extend(self.domains)
-        primitives.extend(self.capabilities)
-        primitives.extend(self.policies)
-        primitives.extend(self.connectors)
-        primitives.extend(self.bindings)
-        return primitives
+    def _confirmable_primitives(self) -> Iterator:
+        """Iterate all primitives that have a confirmation field."""
+        return itertools.chain(
+            (self.scope,),
+            self.archetypes,
+            self.domains,
+            self.capabilities,
+            self.policies,
+            self.connectors,
+            self.bindings,
+        )
+
+    def _count_confirmations(self) -> tuple[int, int, int]:
+        """Walk the confirmable primitives once.
+
+        Returns (confirmed, unconfirmed, total). Flagged primitives count
+        toward the total but are neither confirmed nor unconfirmed.
+        """
+        confirmed = unconfirmed = total = 0
+        for p in self._confirmable_primitives():
+            total += 1
+            if not p.confirmation or p.confirmation.status == ConfirmationStatus.UNCONFIRMED:
+                unconfirmed += 1
+            elif p.confirmation.status in CONFIRMED_STATUSES:
+                confirmed += 1
+        return confirmed, unconfirmed, total
 
     def confirmed_count(self) -> int:
         """Count of all primitives with confirmed or corrected status."""
-        count = 0
-        for p in self._confirmable_primitives():
-            if p.confirmation and p.confirmation.status in (
-                ConfirmationStatus.CONFIRMED,
-                ConfirmationStatus.CORRECTED,
-            ):
-                count += 1
-        return count
+        return self._count_confirmations()[0]
 
     def unconfirmed_count(self) -> int:
         """Count of primitives still awaiting confirmation."""
-        count = 0
-        for p in self._confirmable_primitives():
-            if not p.confirmation or p.confirmation.status == ConfirmationStatus.UNCONFIRMED:
-                count += 1
-        return count
+        return self._count_confirmations()[1]
 
     def total_confirmable(self) -> int:
         """Total number of confirmable primitives."""
-        return len(self._confirmable_primitives())
+        return self._count_confirmations()[2]
 
     def compute_completion(self) -> float:
         """Recompute and return completion percentage."""
-        total = self.total_confirmable()
+        confirmed, _, total = self._count_confirmations()
         if total == 0:
             return 0.0
-        self.completion_percentage = (self.confirmed_count() / total) * 100.0
+        self.completion_percentage = (confirmed / total) * 100.0
         return self.completion_percentage
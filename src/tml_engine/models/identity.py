@@ -15,6 +15,10 @@ class ConfirmationStatus(StrEnum):
     FLAGGED = "flagged"
 
 
+# Statuses that count as human-confirmed (a correction is a confirmed edit)
+CONFIRMED_STATUSES = frozenset({ConfirmationStatus.CONFIRMED, ConfirmationStatus.CORRECTED})
+
+
 class HumanIdentity(BaseModel):
     """Anchored to a real-world identity provider (Google Workspace, etc.).
     Not a TML primitive — this is the real-world anchor that Archetypes reference."""
@@ -61,11 +61,11 @@ async def persist_structured_primitives(
 ) -> None:
     """Persist all structured primitives and provenance entries to storage."""
     # Store the scope
-    await storage.store_primitive(
+    await storage.store_primitive_raw(
         primitive_id=scope.id,
         primitive_type="scope",
         scope_id=None,
-        data=scope.model_dump(mode="json"),
+        data_json=scope.model_dump_json(),
         source=source_label,
         identity_id=identity_id,
         extraction_id=extraction_id,
@@ -79,7 +79,7 @@ async def persist_structured_primitives(
             archetype.id,
             "archetype",
             structured.scope_id,
-            archetype.model_dump(mode="json"),
+            archetype.model_dump_json(),
             source_label,
             identity_id,
             extraction_id,
@@ -91,7 +91,7 @@ async def persist_structured_primitives(
             domain.id,
             "domain",
             structured.scope_id,
-            domain.model_dump(mode="json"),
+            domain.model_dump_json(),
             source_label,
             identity_id,
             extraction_id,
@@ -103,7 +103,7 @@ async def persist_structured_primitives(
             capability.id,
             "capability",
             structured.scope_id,
-            capability.model_dump(mode="json"),
+            capability.model_dump_json(),
             source_label,
             identity_id,
             extraction_id,
@@ -115,7 +115,7 @@ async def persist_structured_primitives(
             policy.id,
             "policy",
             structured.scope_id,
-            policy.model_dump(mode="json"),
+            policy.model_dump_json(),
             source_label,
             identity_id,
             extraction_id,
@@ -127,7 +127,7 @@ async def persist_structured_primitives(
             connector.id,
             "connector",
             structured.scope_id,
-            connector.model_dump(mode="json"),
+            connector.model_dump_json(),
             source_label,
             identity_id,
             extraction_id,
@@ -139,7 +139,7 @@ async def persist_structured_primitives(
             binding.id,
             "binding",
             structured.scope_id,
-            binding.model_dump(mode="json"),
+            binding.model_dump_json(),
             source_label,
             identity_id,
             extraction_id,
@@ -151,16 +151,16 @@ async def _store_and_track(
     primitive_id: str,
     primitive_type: str,
     scope_id: str,
-    data: dict,
+    data_json: str,
     source: str,
     identity_id: str,
     extraction_id: str,
 ) -> None:
-    await storage.store_primitive(
+    await storage.store_primitive_raw(
         primitive_id=primitive_id,
         primitive_type=primitive_type,
         scope_id=scope_id,
-        data=data,
+        data_json=data_json,
         source=source,
         identity_id=identity_id,
         extraction_id=extraction_id,
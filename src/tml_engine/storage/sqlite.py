@@ -3,11 +3,30 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 
 import aiosqlite
 
+# Stay below SQLite's bound-parameter limit (999 on older builds) for IN (...) lookups
+_MAX_IN_PARAMS = 900
+
+# Shared by store_primitive_raw and store_primitives_bulk
+_UPSERT_PRIMITIVE = """
+INSERT INTO primitives (id, type, scope_id, identity_id, extraction_id, data, source)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+  data=excluded.data,
+  updated_at=CURRENT_TIMESTAMP
+"""
+
+# Row keys accepted by store_primitives_bulk
+_BULK_ROW_REQUIRED = frozenset(
+    {"primitive_id", "primitive_type", "scope_id", "data_json", "source"}
+)
+_BULK_ROW_OPTIONAL = frozenset({"identity_id", "extraction_id"})
+
 _SCHEMA = """
 -- Human identities (anchored to identity provider)
 CREATE TABLE IF NOT EXISTS identities (
@@ -152,24 +171,73 @@ class StorageEngine:
         identity_id: str | None = None,
         extraction_id: str | None = None,
     ) -> None:
+        await self.store_primitive_raw(
+            primitive_id=primitive_id,
+            primitive_type=primitive_type,
+            scope_id=scope_id,
+            data_json=json.dumps(data),
+            source=source,
+            identity_id=identity_id,
+            extraction_id=extraction_id,
+        )
+
+    async def store_primitive_raw(
+        self,
+        *,
+        primitive_id: str,
+        primitive_type: str,
+        scope_id: str | None,
+        data_json: str,
+        source: str,
+        identity_id: str | None = None,
+        extraction_id: str | None = None,
+    ) -> None:
+        """Store a primitive whose data is already serialized, e.g. by model_dump_json()."""
         await self.db.execute(
-            """INSERT INTO primitives (id, type, scope_id, identity_id, extraction_id, data, source)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(id) DO UPDATE SET
-                 data=excluded.data,
-                 updated_at=CURRENT_TIMESTAMP""",
+            _UPSERT_PRIMITIVE,
             (
                 primitive_id,
                 primitive_type,
                 scope_id,
                 identity_id,
                 extraction_id,
-                json.dumps(data),
+                data_json,
                 source,
             ),
         )
         await self.db.commit()
 
+    async def store_primitives_bulk(self, rows: Sequence[dict]) -> None:
+        """Store many primitives with one executemany and a single commit.
+
+        Each row takes the store_primitive_raw keyword arguments as keys: data is
+        given pre-serialized as data_json, and identity_id and extraction_id are
+        optional. Rows with missing or unknown keys raise ValueError before
+        anything is written.
+        """
+        params = []
+        for row in rows:
+            missing = _BULK_ROW_REQUIRED - row.keys()
+            unexpected = row.keys() - _BULK_ROW_REQUIRED - _BULK_ROW_OPTIONAL
+            if missing or unexpected:
+                raise ValueError(
+                    f"Invalid primitive row {row.get('primitive_id')!r}: "
+                    f"missing {sorted(missing)}, unexpected {sorted(unexpected)}"
+                )
+            params.append(
+                (
+                    row["primitive_id"],
+                    row["primitive_type"],
+                    row["scope_id"],
+                    row.get("identity_id"),
+                    row.get("extraction_id"),
+                    row["data_json"],
+                    row["source"],
+                )
+            )
+        await self.db.executemany(_UPSERT_PRIMITIVE, params)
+        await self.db.commit()
+
     async def get_primitive(self, primitive_id: str) -> dict | None:
         cursor = await self.db.execute("SELECT * FROM primitives WHERE id = ?", (primitive_id,))
         row = await cursor.fetchone()
@@ -328,6 +396,23 @@ class StorageEngine:
         row = await cursor.fetchone()
         return dict(row) if row else None
 
+    async def get_identities_by_emails(self, emails: Sequence[str]) -> dict[str, dict]:
+        """Look up many identities in as few queries as possible, keyed by email.
+
+        Emails with no stored identity are absent from the result.
+        """
+        found: dict[str, dict] = {}
+        unique = list(dict.fromkeys(emails))
+        for start in range(0, len(unique), _MAX_IN_PARAMS):
+            chunk = unique[start : start + _MAX_IN_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = await self.db.execute(
+                f"SELECT * FROM identities WHERE email IN ({placeholders})", chunk
+            )
+            for row in await cursor.fetchall():
+                found[row["email"]] = dict(row)
+        return found
+
     async def list_primitives_by_identity(self, identity_id: str) -> list[dict]:
         cursor = await self.db.execute(
             "SELECT * FROM primitives WHERE identity_id = ? ORDER BY created_at",
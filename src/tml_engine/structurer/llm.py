@@ -27,6 +27,9 @@ from tml_engine.models.primitives import (
     SkillReference,
 )
 
+# A ```json (or bare ```) fenced block in an LLM response
+_CODE_FENCE = re.compile(r"```(?:json)?\s*\n(.*?)\n```", re.DOTALL)
+
 _SYSTEM_PROMPT = """You are a TML (The Missing Layer) structuring engine. Your job is to analyze
 raw extracted content and identify instances of TML primitives.
 
@@ -218,7 +221,7 @@ class LLMStructurer:
     def _extract_json(self, text: str) -> dict:
         """Extract JSON from LLM response text, handling code fences."""
         # Try to find JSON in code fences first
-        match = re.search(r"```(?:json)?\s*\n(.*?)\n```", text, re.DOTALL)
+        match = _CODE_FENCE.search(text)
         if match:
             return json.loads(match.group(1))
         # Try the whole text as JSON
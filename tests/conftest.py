@@ -0,0 +1,48 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+
+import pytest_asyncio
+
+from tml_engine.storage.sqlite import StorageEngine
+
+
+@pytest_asyncio.fixture(scope="session")
+async def storage_engine():
+    """A single initialized StorageEngine, so the schema is created once per session.
+
+    Backed by an in-memory database: tests never need durability, and this keeps
+    commits off the filesystem entirely. A plain ":memory:" database is private to
+    its connection, so parallel runners that use one process per worker each get
+    their own isolated copy.
+    """
+    engine = StorageEngine(Path(":memory:"))
+    await engine.initialize()
+    yield engine
+    await engine.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def storage_tables(storage_engine: StorageEngine) -> tuple[str, ...]:
+    """Every table in the storage schema, read once from sqlite_master.
+
+    Newest first: the schema creates referenced tables before their dependents.
+    """
+    cursor = await storage_engine.db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+        "ORDER BY rowid DESC"
+    )
+    return tuple(row[0] for row in await cursor.fetchall())
+
+
+@pytest_asyncio.fixture
+async def storage(storage_engine: StorageEngine, storage_tables: tuple[str, ...]) -> StorageEngine:
+    """The shared StorageEngine, emptied before each test.
+
+    StorageEngine commits after every write, so tests are isolated by clearing
+    rows rather than by rolling back a transaction or savepoint.
+    """
+    for table in storage_tables:
+        await storage_engine.db.execute(f"DELETE FROM {table}")
+    await storage_engine.db.commit()
+    return storage_engine
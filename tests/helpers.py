@@ -0,0 +1,6 @@
+"""Shared test constants."""
+
+from datetime import UTC, datetime
+
+# Fixed timestamp for fixtures, so no test depends on wall-clock time
+FROZEN_NOW = datetime(2025, 1, 1, tzinfo=UTC)
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 import pytest_asyncio
 
@@ -18,15 +16,6 @@ from tml_engine.confirmation.provenance import make_provenance_entry
 from tml_engine.storage.sqlite import StorageEngine
 
 
-@pytest_asyncio.fixture
-async def storage(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-    engine = StorageEngine(db_path)
-    await engine.initialize()
-    yield engine
-    await engine.close()
-
-
 @pytest_asyncio.fixture
 async def seeded_storage(storage: StorageEngine):
     """Storage with identity and primitives pre-loaded from mock data."""
@@ -34,16 +34,6 @@ from tml_engine.pipeline import build_declaration_from_storage, find_scope_for_i
 from tml_engine.storage.sqlite import StorageEngine
 
 
-@pytest.fixture
-async def storage(tmp_path: Path) -> StorageEngine:
-    """Create and initialize a temporary StorageEngine."""
-    db_path = tmp_path / "e2e_test.db"
-    engine = StorageEngine(db_path)
-    await engine.initialize()
-    yield engine
-    await engine.close()
-
-
 async def _seed_mock_data(storage: StorageEngine) -> str:
     """Persist the full mock dataset into storage, simulating extract → structure → persist.
 
@@ -1,9 +1,8 @@
 """Tests for OrganizationalGraph computation."""
 
-from datetime import UTC, datetime
-
 import pytest
 
+from tests.helpers import FROZEN_NOW
 from tml_engine.graph.compute import (
     _classify_dependency,
     _score_capability,
@@ -30,27 +29,89 @@ from tml_engine.models.primitives import (
     SkillReference,
 )
 
+# Prototypes are built once at import from trusted literals with model_construct
+# (no validation); helpers derive variants with model_copy(update=...). Tests
+# treat them as read-only.
+_IDENTITY = HumanIdentity.model_construct(email="test@example.com", display_name="Test User")
+_SOURCE = ExtractionSource.model_construct(
+    source_type="test", source_identifier="test", extracted_at=FROZEN_NOW
+)
+_FACTOR = DecisionFactor.model_construct(name="F1", description="Factor", weight="primary")
+_EXCEPTION = ExceptionRule.model_construct(
+    trigger="Edge case", override_description="Override", reason="Reason"
+)
+_SKILL = SkillReference.model_construct(
+    id="sk-1", name="Tool", description="A tool", skill_type="tool"
+)
+_CONFIRMATION = ConfirmationRecord.model_construct(
+    status=ConfirmationStatus.CONFIRMED,
+    confirmed_by=_IDENTITY,
+    confirmed_at=FROZEN_NOW,
+)
 
-def _now() -> datetime:
-    return datetime.now(UTC)
-
-
-def _identity() -> HumanIdentity:
-    return HumanIdentity(email="test@example.com", display_name="Test User")
+_PROTO_SCOPE = Scope.model_construct(
+    id="scope-1",
+    name="Test Scope",
+    description="Test",
+    owner_identity=_IDENTITY,
+    source=_SOURCE,
+)
+_PROTO_DECLARATION = Declaration.model_construct(
+    id="decl-scope-1",
+    version="0.1.0",
+    scope=_PROTO_SCOPE,
+    archetypes=[],
+    domains=[],
+    capabilities=[],
+    views=[],
+    policies=[],
+    connectors=[],
+    bindings=[],
+    provenance=[],
+    created_at=FROZEN_NOW,
+)
+_PROTO_ARCHETYPE = Archetype.model_construct(
+    id="arch-1",
+    scope_id="scope-1",
+    identity=_IDENTITY,
+    role_name="Test Role",
+    role_description="Test",
+    primary_responsibilities=["Test"],
+    decision_authority=["Test"],
+    accountability_boundaries=["Test"],
+    source=_SOURCE,
+)
+_PROTO_DOMAIN = Domain.model_construct(
+    id="dom-1",
+    scope_id="scope-1",
+    name="Test Domain",
+    description="Test",
+    outcome_definition="Success",
+    accountable_archetype_id="arch-1",
+    source=_SOURCE,
+)
+_PROTO_CAPABILITY = Capability.model_construct(
+    id="cap-1",
+    scope_id="scope-1",
+    domain_id="dom-1",
+    name="Test Capability",
+    description="Test",
+    outcome="Good outcome",
+    decision_factors=[],
+    heuristics=[],
+    anti_patterns=[],
+    exceptions=[],
+    skills=[],
+    source=_SOURCE,
+)
 
 
 def _source() -> ExtractionSource:
-    return ExtractionSource(source_type="test", source_identifier="test", extracted_at=_now())
+    return _SOURCE
 
 
 def _scope(scope_id: str = "scope-1") -> Scope:
-    return Scope(
-        id=scope_id,
-        name="Test Scope",
-        description="Test",
-        owner_identity=_identity(),
-        source=_source(),
-    )
+    return _PROTO_SCOPE.model_copy(update={"id": scope_id})
 
 
 def _declaration(
@@ -62,45 +123,27 @@ def _declaration(
     bindings: list | None = None,
     policies: list | None = None,
 ) -> Declaration:
-    return Declaration(
-        id=f"decl-{scope_id}",
-        version="0.1.0",
-        scope=_scope(scope_id),
-        archetypes=archetypes or [],
-        domains=domains or [],
-        capabilities=capabilities or [],
-        views=[],
-        policies=policies or [],
-        connectors=connectors or [],
-        bindings=bindings or [],
-        provenance=[],
-        created_at=_now(),
+    return _PROTO_DECLARATION.model_copy(
+        update={
+            "id": f"decl-{scope_id}",
+            "scope": _scope(scope_id),
+            "archetypes": archetypes or [],
+            "domains": domains or [],
+            "capabilities": capabilities or [],
+            "policies": policies or [],
+            "connectors": connectors or [],
+            "bindings": bindings or [],
+        }
     )
 
 
 def _archetype(arch_id: str = "arch-1", scope_id: str = "scope-1") -> Archetype:
-    return Archetype(
-        id=arch_id,
-        scope_id=scope_id,
-        identity=_identity(),
-        role_name="Test Role",
-        role_description="Test",
-        primary_responsibilities=["Test"],
-        decision_authority=["Test"],
-        accountability_boundaries=["Test"],
-        source=_source(),
-    )
+    return _PROTO_ARCHETYPE.model_copy(update={"id": arch_id, "scope_id": scope_id})
 
 
 def _domain(dom_id: str = "dom-1", scope_id: str = "scope-1", arch_id: str = "arch-1") -> Domain:
-    return Domain(
-        id=dom_id,
-        scope_id=scope_id,
-        name="Test Domain",
-        description="Test",
-        outcome_definition="Success",
-        accountable_archetype_id=arch_id,
-        source=_source(),
+    return _PROTO_DOMAIN.model_copy(
+        update={"id": dom_id, "scope_id": scope_id, "accountable_archetype_id": arch_id}
     )
 
 
@@ -116,45 +159,28 @@ def _capability(
     with_skills: bool = True,
     confirmed: bool = False,
 ) -> Capability:
-    factors = (
-        [DecisionFactor(name="F1", description="Factor", weight="primary")] if with_factors else []
-    )
-    heuristics = ["Rule of thumb"] if with_heuristics else []
-    anti_patterns = ["Bad practice"] if with_anti_patterns else []
-    exceptions = (
-        [ExceptionRule(trigger="Edge case", override_description="Override", reason="Reason")]
-        if with_exceptions
-        else []
-    )
-    skills = (
-        [SkillReference(id="sk-1", name="Tool", description="A tool", skill_type="tool")]
-        if with_skills
-        else []
-    )
-    confirmation = (
-        ConfirmationRecord(
-            status=ConfirmationStatus.CONFIRMED,
-            confirmed_by=_identity(),
-            confirmed_at=_now(),
-        )
-        if confirmed
-        else None
+    return _PROTO_CAPABILITY.model_copy(
+        update={
+            "id": cap_id,
+            "scope_id": scope_id,
+            "domain_id": domain_id,
+            "decision_factors": [_FACTOR] if with_factors else [],
+            "heuristics": ["Rule of thumb"] if with_heuristics else [],
+            "anti_patterns": ["Bad practice"] if with_anti_patterns else [],
+            "exceptions": [_EXCEPTION] if with_exceptions else [],
+            "skills": [_SKILL] if with_skills else [],
+            "confirmation": _CONFIRMATION if confirmed else None,
+        }
     )
 
-    return Capability(
-        id=cap_id,
-        scope_id=scope_id,
-        domain_id=domain_id,
-        name="Test Capability",
-        description="Test",
-        outcome="Good outcome",
-        decision_factors=factors,
-        heuristics=heuristics,
-        anti_patterns=anti_patterns,
-        exceptions=exceptions,
-        skills=skills,
-        confirmation=confirmation,
-        source=_source(),
+
+@pytest.fixture(scope="module")
+def base_declaration() -> Declaration:
+    """One archetype, domain and default capability; tests vary it with model_copy."""
+    return _declaration(
+        archetypes=[_archetype()],
+        domains=[_domain()],
+        capabilities=[_capability()],
     )
 
 
@@ -185,6 +211,9 @@ class TestClassifyDependency:
     def test_informing_explicit(self) -> None:
         assert _classify_dependency("This informs the next step") == "informing"
 
+    def test_blocking_takes_precedence(self) -> None:
+        assert _classify_dependency("Review gates release and REQUIRES sign-off") == "blocking"
+
 
 class TestDecisionFlowTracing:
     def test_matching_binding_connector(self) -> None:
@@ -280,6 +309,7 @@ class TestScoreCapability:
         )
         score, missing, rationale = _score_capability(cap)
         assert score == 0.0
+        assert isinstance(score, float)
         assert len(missing) == 6
         assert rationale == []
 
@@ -303,56 +333,42 @@ class TestComputeOrganizationalGraph:
         with pytest.raises(ValueError, match="At least one Declaration"):
             compute_organizational_graph([])
 
-    def test_single_declaration(self) -> None:
-        decl = _declaration(
-            archetypes=[_archetype()],
-            domains=[_domain()],
-            capabilities=[_capability()],
-        )
-        graph = compute_organizational_graph([decl])
+    def test_single_declaration(self, base_declaration: Declaration) -> None:
+        graph = compute_organizational_graph([base_declaration])
         assert graph.root_scope.id == "scope-1"
         assert len(graph.declarations) == 1
         assert len(graph.automation_candidates) == 1
 
-    def test_automation_candidate_scoring(self) -> None:
+    @pytest.mark.parametrize(
+        ("enabled", "readiness", "skill_type", "missing_count"),
+        [
+            pytest.param(True, 1.0, "agent_skill", 0, id="full"),
+            pytest.param(False, 0.0, "copilot", 6, id="empty"),
+        ],
+    )
+    def test_automation_candidate_scoring(
+        self,
+        base_declaration: Declaration,
+        enabled: bool,
+        readiness: float,
+        skill_type: str,
+        missing_count: int,
+    ) -> None:
         cap = _capability(
-            with_factors=True,
-            with_heuristics=True,
-            with_anti_patterns=True,
-            with_exceptions=True,
-            with_skills=True,
-            confirmed=True,
-        )
-        decl = _declaration(
-            archetypes=[_archetype()],
-            domains=[_domain()],
-            capabilities=[cap],
+            with_factors=enabled,
+            with_heuristics=enabled,
+            with_anti_patterns=enabled,
+            with_exceptions=enabled,
+            with_skills=enabled,
+            confirmed=enabled,
         )
+        decl = base_declaration.model_copy(update={"capabilities": [cap]})
         graph = compute_organizational_graph([decl])
         assert len(graph.automation_candidates) == 1
         candidate = graph.automation_candidates[0]
-        assert candidate.automation_readiness == 1.0
-        assert candidate.recommended_skill_type == "agent_skill"
-        assert candidate.missing_elements == []
-
-    def test_low_readiness_copilot(self) -> None:
-        cap = _capability(
-            with_factors=False,
-            with_heuristics=False,
-            with_anti_patterns=False,
-            with_exceptions=False,
-            with_skills=False,
-            confirmed=False,
-        )
-        decl = _declaration(
-            archetypes=[_archetype()],
-            domains=[_domain()],
-            capabilities=[cap],
-        )
-        graph = compute_organizational_graph([decl])
-        candidate = graph.automation_candidates[0]
-        assert candidate.automation_readiness == 0.0
-        assert candidate.recommended_skill_type == "copilot"
+        assert candidate.automation_readiness == readiness
+        assert candidate.recommended_skill_type == skill_type
+        assert len(candidate.missing_elements) == missing_count
 
     def test_cross_declaration_flows(self) -> None:
         decl_a = _declaration(
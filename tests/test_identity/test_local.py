@@ -1,25 +1,13 @@
 """Tests for the local identity provider."""
 
-from pathlib import Path
-
 import pytest
-import pytest_asyncio
 
 from tml_engine.identity.local import LocalIdentityProvider
 from tml_engine.storage.sqlite import StorageEngine
 
 
-@pytest_asyncio.fixture
-async def storage(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-    engine = StorageEngine(db_path)
-    await engine.initialize()
-    yield engine
-    await engine.close()
-
-
-@pytest_asyncio.fixture
-async def provider(storage: StorageEngine):
+@pytest.fixture
+def provider(storage: StorageEngine) -> LocalIdentityProvider:
     return LocalIdentityProvider(storage)
 
 
@@ -55,6 +43,24 @@ async def test_resolve_underscore_email(provider: LocalIdentityProvider) -> None
     assert identity.display_name == "Jane Doe"
 
 
+@pytest.mark.asyncio
+async def test_resolve_many_underscore_email(
+    storage: StorageEngine, provider: LocalIdentityProvider
+) -> None:
+    await storage.upsert_identity(
+        identity_id="id-1",
+        email="alice@example.com",
+        display_name="Alice Smith",
+        title="Engineer",
+    )
+    identities = await provider.resolve_many(["jane_doe@example.com", "alice@example.com"])
+    assert [i.email for i in identities] == ["jane_doe@example.com", "alice@example.com"]
+    assert identities[0].display_name == "Jane Doe"
+    assert identities[0].title is None
+    assert identities[1].display_name == "Alice Smith"
+    assert identities[1].title == "Engineer"
+
+
 @pytest.mark.asyncio
 async def test_list_available_empty(provider: LocalIdentityProvider) -> None:
     result = await provider.list_available()
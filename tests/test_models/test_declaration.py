@@ -18,11 +18,11 @@ from tml_engine.models.primitives import (
 
 
 def _identity() -> HumanIdentity:
-    return HumanIdentity(email="test@example.com", display_name="Test User")
+    return HumanIdentity.model_construct(email="test@example.com", display_name="Test User")
 
 
 def _source() -> ExtractionSource:
-    return ExtractionSource(
+    return ExtractionSource.model_construct(
         source_type="interview",
         source_identifier="test-session",
         extracted_at=datetime(2025, 1, 1, tzinfo=UTC),
@@ -30,7 +30,7 @@ def _source() -> ExtractionSource:
 
 
 def _confirmed() -> ConfirmationRecord:
-    return ConfirmationRecord(
+    return ConfirmationRecord.model_construct(
         status=ConfirmationStatus.CONFIRMED,
         confirmed_by=_identity(),
         confirmed_at=datetime(2025, 1, 2, tzinfo=UTC),
@@ -44,7 +44,12 @@ def _make_declaration(
     domain_confirmed: bool = False,
     cap_confirmed: bool = False,
 ) -> Declaration:
-    scope = Scope(
+    """Build a Declaration from trusted literals.
+
+    Uses model_construct throughout to skip validation; the JSON round-trip
+    test re-validates the dumped data with model_validate.
+    """
+    scope = Scope.model_construct(
         id="scope-1",
         name="Test Scope",
         description="Test",
@@ -52,7 +57,7 @@ def _make_declaration(
         confirmation=_confirmed() if scope_confirmed else None,
         source=_source(),
     )
-    archetype = Archetype(
+    archetype = Archetype.model_construct(
         id="arch-1",
         scope_id="scope-1",
         identity=_identity(),
@@ -64,7 +69,7 @@ def _make_declaration(
         confirmation=_confirmed() if archetype_confirmed else None,
         source=_source(),
     )
-    domain = Domain(
+    domain = Domain.model_construct(
         id="domain-1",
         scope_id="scope-1",
         name="Testing Domain",
@@ -74,7 +79,7 @@ def _make_declaration(
         confirmation=_confirmed() if domain_confirmed else None,
         source=_source(),
     )
-    capability = Capability(
+    capability = Capability.model_construct(
         id="cap-1",
         scope_id="scope-1",
         domain_id="domain-1",
@@ -89,7 +94,7 @@ def _make_declaration(
         confirmation=_confirmed() if cap_confirmed else None,
         source=_source(),
     )
-    return Declaration(
+    return Declaration.model_construct(
         id="decl-1",
         version="0.1.0",
         scope=scope,
@@ -127,6 +132,19 @@ class TestDeclaration:
         assert decl.confirmed_count() == 4
         assert decl.unconfirmed_count() == 0
 
+    def test_flagged_counts_toward_total_only(self) -> None:
+        decl = _make_declaration(scope_confirmed=True)
+        decl.domains[0].confirmation = ConfirmationRecord.model_construct(
+            status=ConfirmationStatus.FLAGGED,
+            confirmed_by=_identity(),
+            confirmed_at=datetime(2025, 1, 2, tzinfo=UTC),
+            flag_reason="Wrong owner",
+        )
+        assert decl.confirmed_count() == 1
+        assert decl.unconfirmed_count() == 2
+        assert decl.total_confirmable() == 4
+        assert decl.compute_completion() == 25.0
+
     def test_completion_percentage(self) -> None:
         decl = _make_declaration(scope_confirmed=True, archetype_confirmed=True)
         pct = decl.compute_completion()
@@ -142,9 +160,16 @@ class TestDeclaration:
         pct = decl.compute_completion()
         assert pct == 100.0
 
-    def test_serialization_round_trip(self) -> None:
+    def test_json_round_trip(self) -> None:
         decl = _make_declaration(scope_confirmed=True)
         data = decl.model_dump(mode="json")
         restored = Declaration.model_validate(data)
         assert restored.id == decl.id
         assert restored.confirmed_count() == 1
+
+    def test_model_copy_round_trip(self) -> None:
+        decl = _make_declaration(scope_confirmed=True)
+        copied = decl.model_copy(deep=True)
+        assert copied == decl
+        assert copied.scope is not decl.scope
+        assert copied.confirmed_count() == 1
@@ -14,11 +14,11 @@ from tml_engine.models.primitives import Scope
 
 
 def _identity() -> HumanIdentity:
-    return HumanIdentity(email="test@example.com", display_name="Test")
+    return HumanIdentity.model_construct(email="test@example.com", display_name="Test")
 
 
 def _source() -> ExtractionSource:
-    return ExtractionSource(
+    return ExtractionSource.model_construct(
         source_type="interview",
         source_identifier="test",
         extracted_at=datetime(2025, 1, 1, tzinfo=UTC),
@@ -26,7 +26,7 @@ def _source() -> ExtractionSource:
 
 
 def _scope() -> Scope:
-    return Scope(
+    return Scope.model_construct(
         id="scope-root",
         name="Root",
         description="Root scope",
@@ -36,7 +36,7 @@ def _scope() -> Scope:
 
 
 def _declaration() -> Declaration:
-    return Declaration(
+    return Declaration.model_construct(
         id="decl-1",
         version="0.1.0",
         scope=_scope(),
@@ -52,6 +52,26 @@ def _declaration() -> Declaration:
     )
 
 
+def _graph_with_flow() -> OrganizationalGraph:
+    return OrganizationalGraph(
+        root_scope=_scope(),
+        declarations=[_declaration()],
+        decision_flows=[
+            DecisionFlow(
+                from_archetype_id="a1",
+                from_capability_id="c1",
+                to_archetype_id="a2",
+                to_capability_id="c2",
+                via_binding_id="b1",
+                via_connector_id="cn1",
+                description="Test flow",
+            ),
+        ],
+        dependency_map=[],
+        automation_candidates=[],
+    )
+
+
 class TestDecisionFlow:
     def test_create(self) -> None:
         flow = DecisionFlow(
@@ -103,24 +123,14 @@ class TestOrganizationalGraph:
         )
         assert len(graph.declarations) == 1
 
-    def test_serialization_round_trip(self) -> None:
-        graph = OrganizationalGraph(
-            root_scope=_scope(),
-            declarations=[_declaration()],
-            decision_flows=[
-                DecisionFlow(
-                    from_archetype_id="a1",
-                    from_capability_id="c1",
-                    to_archetype_id="a2",
-                    to_capability_id="c2",
-                    via_binding_id="b1",
-                    via_connector_id="cn1",
-                    description="Test flow",
-                ),
-            ],
-            dependency_map=[],
-            automation_candidates=[],
-        )
+    def test_json_round_trip(self) -> None:
+        graph = _graph_with_flow()
         data = graph.model_dump(mode="json")
         restored = OrganizationalGraph.model_validate(data)
         assert len(restored.decision_flows) == 1
+
+    def test_model_copy_round_trip(self) -> None:
+        graph = _graph_with_flow()
+        copied = graph.model_copy(deep=True)
+        assert copied == graph
+        assert copied.decision_flows[0] is not graph.decision_flows[0]
@@ -2,6 +2,8 @@
 
 from datetime import UTC, datetime
 
+import pytest
+
 from tml_engine.models.identity import (
     ConfirmationRecord,
     ConfirmationStatus,
@@ -23,62 +25,115 @@ from tml_engine.models.primitives import (
     View,
 )
 
+# Shared value objects, built once at import; tests treat them as read-only
+_IDENTITY = HumanIdentity(email="michael@cobrachicken.ai", display_name="Michael")
+_SOURCE = ExtractionSource(
+    source_type="interview",
+    source_identifier="session-001",
+    extracted_at=datetime(2025, 1, 1, tzinfo=UTC),
+)
+_CONFIRMATION = ConfirmationRecord(
+    status=ConfirmationStatus.CONFIRMED,
+    confirmed_by=_IDENTITY,
+    confirmed_at=datetime(2025, 1, 2, tzinfo=UTC),
+)
+
 
 def _make_identity() -> HumanIdentity:
-    return HumanIdentity(email="michael@cobrachicken.ai", display_name="Michael")
+    return _IDENTITY
 
 
 def _make_source() -> ExtractionSource:
-    return ExtractionSource(
-        source_type="interview",
-        source_identifier="session-001",
-        extracted_at=datetime(2025, 1, 1, tzinfo=UTC),
-    )
-
-
-def _make_confirmation() -> ConfirmationRecord:
-    return ConfirmationRecord(
-        status=ConfirmationStatus.CONFIRMED,
-        confirmed_by=_make_identity(),
-        confirmed_at=datetime(2025, 1, 2, tzinfo=UTC),
+    return _SOURCE
+
+
+@pytest.fixture(scope="module")
+def full_capability() -> Capability:
+    """A Capability with every nested structure populated; tests treat it as read-only."""
+    return Capability(
+        id="cap-1",
+        scope_id="scope-root",
+        domain_id="domain-1",
+        name="Carrier Safety Assessment",
+        description="Evaluate carrier safety record and compliance",
+        outcome="Approved or rejected carrier based on safety criteria",
+        decision_factors=[
+            DecisionFactor(name="Safety Score", description="DOT safety rating", weight="primary"),
+            DecisionFactor(name="Insurance Coverage", description="Liability limits"),
+        ],
+        heuristics=["Score below 70 is automatic reject", "Check last 3 years of incidents"],
+        anti_patterns=["Ignoring recent incidents because historical score is good"],
+        exceptions=[
+            ExceptionRule(
+                trigger="Emergency load with no approved carriers available",
+                override_description="Allow provisional approval with enhanced monitoring",
+                reason="Business continuity requires flexibility in emergencies",
+            ),
+        ],
+        skills=[
+            SkillReference(
+                id="skill-1",
+                name="SaferSys Lookup",
+                description="Query FMCSA SaferSys for carrier data",
+                skill_type="tool",
+            ),
+        ],
+        source=_make_source(),
     )
 
 
 class TestScope:
-    def test_create_root_scope(self) -> None:
-        scope = Scope(
-            id="scope-root",
-            name="CobraChicken AI",
-            description="Root organizational scope",
-            owner_identity=_make_identity(),
-            source=_make_source(),
-        )
-        assert scope.id == "scope-root"
-        assert scope.parent_scope_id is None
-        assert scope.confirmation is None
-
-    def test_create_nested_scope(self) -> None:
-        scope = Scope(
-            id="scope-team",
-            name="Engineering",
-            description="Engineering team scope",
-            parent_scope_id="scope-root",
-            owner_identity=_make_identity(),
-            source=_make_source(),
-        )
-        assert scope.parent_scope_id == "scope-root"
-
-    def test_scope_with_confirmation(self) -> None:
-        scope = Scope(
-            id="scope-1",
-            name="Test",
-            description="Test scope",
-            owner_identity=_make_identity(),
-            confirmation=_make_confirmation(),
-            source=_make_source(),
-        )
-        assert scope.confirmation is not None
-        assert scope.confirmation.status == ConfirmationStatus.CONFIRMED
+    @pytest.mark.parametrize(
+        ("kwargs", "parent_scope_id", "confirmation_status"),
+        [
+            pytest.param(
+                {
+                    "id": "scope-root",
+                    "name": "CobraChicken AI",
+                    "description": "Root organizational scope",
+                },
+                None,
+                None,
+                id="root",
+            ),
+            pytest.param(
+                {
+                    "id": "scope-team",
+                    "name": "Engineering",
+                    "description": "Engineering team scope",
+                    "parent_scope_id": "scope-root",
+                },
+                "scope-root",
+                None,
+                id="nested",
+            ),
+            pytest.param(
+                {
+                    "id": "scope-1",
+                    "name": "Test",
+                    "description": "Test scope",
+                    "confirmation": _CONFIRMATION,
+                },
+                None,
+                ConfirmationStatus.CONFIRMED,
+                id="confirmed",
+            ),
+        ],
+    )
+    def test_create_scope(
+        self,
+        kwargs: dict,
+        parent_scope_id: str | None,
+        confirmation_status: ConfirmationStatus | None,
+    ) -> None:
+        scope = Scope(**kwargs, owner_identity=_make_identity(), source=_make_source())
+        assert scope.id == kwargs["id"]
+        assert scope.parent_scope_id == parent_scope_id
+        if confirmation_status is None:
+            assert scope.confirmation is None
+        else:
+            assert scope.confirmation is not None
+            assert scope.confirmation.status == confirmation_status
 
 
 class TestDomain:
@@ -97,43 +152,11 @@ class TestDomain:
 
 
 class TestCapability:
-    def test_create_capability_with_full_structure(self) -> None:
-        cap = Capability(
-            id="cap-1",
-            scope_id="scope-root",
-            domain_id="domain-1",
-            name="Carrier Safety Assessment",
-            description="Evaluate carrier safety record and compliance",
-            outcome="Approved or rejected carrier based on safety criteria",
-            decision_factors=[
-                DecisionFactor(
-                    name="Safety Score", description="DOT safety rating", weight="primary"
-                ),
-                DecisionFactor(name="Insurance Coverage", description="Liability limits"),
-            ],
-            heuristics=["Score below 70 is automatic reject", "Check last 3 years of incidents"],
-            anti_patterns=["Ignoring recent incidents because historical score is good"],
-            exceptions=[
-                ExceptionRule(
-                    trigger="Emergency load with no approved carriers available",
-                    override_description="Allow provisional approval with enhanced monitoring",
-                    reason="Business continuity requires flexibility in emergencies",
-                ),
-            ],
-            skills=[
-                SkillReference(
-                    id="skill-1",
-                    name="SaferSys Lookup",
-                    description="Query FMCSA SaferSys for carrier data",
-                    skill_type="tool",
-                ),
-            ],
-            source=_make_source(),
-        )
-        assert len(cap.decision_factors) == 2
-        assert len(cap.exceptions) == 1
-        assert len(cap.skills) == 1
-        assert cap.domain_id == "domain-1"
+    def test_create_capability_with_full_structure(self, full_capability: Capability) -> None:
+        assert len(full_capability.decision_factors) == 2
+        assert len(full_capability.exceptions) == 1
+        assert len(full_capability.skills) == 1
+        assert full_capability.domain_id == "domain-1"
 
     def test_empty_capability(self) -> None:
         cap = Capability(
@@ -232,33 +255,40 @@ class TestBinding:
 
 
 class TestProvenance:
-    def test_create_provenance_entry(self) -> None:
-        entry = ProvenanceEntry(
-            id="prov-1",
-            scope_id="scope-root",
-            primitive_id="cap-1",
-            primitive_type="capability",
-            action="confirmed",
-            actor=_make_identity(),
-            timestamp=datetime(2025, 1, 2, tzinfo=UTC),
-            details={"confirmation_status": "confirmed"},
-        )
-        assert entry.action == "confirmed"
-        assert entry.previous_state is None
-
-    def test_provenance_with_previous_state(self) -> None:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(
+                {
+                    "id": "prov-1",
+                    "action": "confirmed",
+                    "timestamp": datetime(2025, 1, 2, tzinfo=UTC),
+                    "details": {"confirmation_status": "confirmed"},
+                },
+                id="entry",
+            ),
+            pytest.param(
+                {
+                    "id": "prov-2",
+                    "action": "corrected",
+                    "timestamp": datetime(2025, 1, 3, tzinfo=UTC),
+                    "details": {"correction": "Updated heuristics"},
+                    "previous_state": {"heuristics": ["old rule"]},
+                },
+                id="previous_state",
+            ),
+        ],
+    )
+    def test_create_provenance_entry(self, kwargs: dict) -> None:
         entry = ProvenanceEntry(
-            id="prov-2",
+            **kwargs,
             scope_id="scope-root",
             primitive_id="cap-1",
             primitive_type="capability",
-            action="corrected",
             actor=_make_identity(),
-            timestamp=datetime(2025, 1, 3, tzinfo=UTC),
-            details={"correction": "Updated heuristics"},
-            previous_state={"heuristics": ["old rule"]},
         )
-        assert entry.previous_state is not None
+        assert entry.action == kwargs["action"]
+        assert entry.previous_state == kwargs.get("previous_state")
 
 
 class TestSerialization:
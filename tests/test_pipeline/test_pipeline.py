@@ -1,71 +1,67 @@
 """Tests for the pipeline module."""
 
-from datetime import UTC, datetime
-from pathlib import Path
-
 import pytest
 import pytest_asyncio
+from pydantic import BaseModel
 
+from tests.helpers import FROZEN_NOW
 from tml_engine.models.identity import ExtractionSource, HumanIdentity
 from tml_engine.models.primitives import (
     Archetype,
+    Binding,
     Capability,
     DecisionFactor,
     Domain,
     Scope,
     SkillReference,
 )
-from tml_engine.pipeline import build_declaration_from_storage, find_scope_for_identity
+from tml_engine.pipeline import (
+    build_declaration_from_storage,
+    find_scope_for_identity,
+    persist_structured_primitives,
+)
 from tml_engine.storage.sqlite import StorageEngine
+from tml_engine.structurer.llm import StructuredPrimitives
 
-
-def _now() -> datetime:
-    return datetime.now(UTC)
+_SOURCE = ExtractionSource(source_type="test", source_identifier="test", extracted_at=FROZEN_NOW)
+_IDENTITY = HumanIdentity(email="test@example.com", display_name="Test User")
 
 
 def _source() -> ExtractionSource:
-    return ExtractionSource(source_type="test", source_identifier="test", extracted_at=_now())
+    return _SOURCE
 
 
 def _identity() -> HumanIdentity:
-    return HumanIdentity(email="test@example.com", display_name="Test User")
+    return _IDENTITY
 
 
-@pytest_asyncio.fixture
-async def storage(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-    engine = StorageEngine(db_path)
-    await engine.initialize()
-    yield engine
-    await engine.close()
-
-
-async def _store_scope(
-    storage: StorageEngine, scope_id: str = "scope-1", identity_id: str = "id-1"
-) -> Scope:
-    """Helper to store a scope primitive."""
-    scope = Scope(
+# The _*_row helpers return store_primitive_raw keyword arguments, the row shape
+# store_primitives_bulk takes. They build primitives from trusted literals with
+# model_construct, skipping validation; build_declaration_from_storage validates
+# them when read back. Rows carry data_json from model_dump_json(), serialized
+# once by pydantic-core.
+
+
+def _scope_row(scope_id: str = "scope-1", identity_id: str = "id-1") -> dict:
+    scope = Scope.model_construct(
         id=scope_id,
         name="Test Scope",
         description="A test scope",
         owner_identity=_identity(),
         source=_source(),
     )
-    await storage.store_primitive(
-        primitive_id=scope_id,
-        primitive_type="scope",
-        scope_id=None,
-        data=scope.model_dump(mode="json"),
-        source="test",
-        identity_id=identity_id,
-    )
-    return scope
-
-
-async def _store_domain(
-    storage: StorageEngine, scope_id: str = "scope-1", identity_id: str = "id-1"
-) -> Domain:
-    domain = Domain(
+    return {
+        "primitive_id": scope_id,
+        "primitive_type": "scope",
+        "scope_id": None,
+        "data_json": scope.model_dump_json(),
+        "source": "test",
+        "identity_id": identity_id,
+    }
+
+
+def _domain_row(scope_id: str = "scope-1", identity_id: str = "id-1") -> dict:
+    domain = Domain.model_construct(
         id="dom-1",
         scope_id=scope_id,
         name="Test Domain",
@@ -74,21 +70,18 @@ async def _store_domain(
         accountable_archetype_id="arch-1",
         source=_source(),
     )
-    await storage.store_primitive(
-        primitive_id="dom-1",
-        primitive_type="domain",
-        scope_id=scope_id,
-        data=domain.model_dump(mode="json"),
-        source="test",
-        identity_id=identity_id,
-    )
-    return domain
-
-
-async def _store_archetype(
-    storage: StorageEngine, scope_id: str = "scope-1", identity_id: str = "id-1"
-) -> Archetype:
-    arch = Archetype(
+    return {
+        "primitive_id": "dom-1",
+        "primitive_type": "domain",
+        "scope_id": scope_id,
+        "data_json": domain.model_dump_json(),
+        "source": "test",
+        "identity_id": identity_id,
+    }
+
+
+def _archetype_row(scope_id: str = "scope-1", identity_id: str = "id-1") -> dict:
+    arch = Archetype.model_construct(
         id="arch-1",
         scope_id=scope_id,
         identity=_identity(),
@@ -99,21 +92,18 @@ async def _store_archetype(
         accountability_boundaries=["Not other things"],
         source=_source(),
     )
-    await storage.store_primitive(
-        primitive_id="arch-1",
-        primitive_type="archetype",
-        scope_id=scope_id,
-        data=arch.model_dump(mode="json"),
-        source="test",
-        identity_id=identity_id,
-    )
-    return arch
-
-
-async def _store_capability(
-    storage: StorageEngine, scope_id: str = "scope-1", identity_id: str = "id-1"
-) -> Capability:
-    cap = Capability(
+    return {
+        "primitive_id": "arch-1",
+        "primitive_type": "archetype",
+        "scope_id": scope_id,
+        "data_json": arch.model_dump_json(),
+        "source": "test",
+        "identity_id": identity_id,
+    }
+
+
+def _capability_row(scope_id: str = "scope-1", identity_id: str = "id-1") -> dict:
+    cap = Capability.model_construct(
         id="cap-1",
         scope_id=scope_id,
         domain_id="dom-1",
@@ -121,38 +111,69 @@ async def _store_capability(
         description="A test capability",
         outcome="Good outcome",
         decision_factors=[
-            DecisionFactor(name="Factor 1", description="Important", weight="primary")
+            DecisionFactor.model_construct(
+                name="Factor 1", description="Important", weight="primary"
+            )
         ],
         heuristics=["Rule of thumb"],
         anti_patterns=["Bad practice"],
         exceptions=[],
-        skills=[SkillReference(id="sk-1", name="Tool", description="A tool", skill_type="tool")],
+        skills=[
+            SkillReference.model_construct(
+                id="sk-1", name="Tool", description="A tool", skill_type="tool"
+            )
+        ],
         source=_source(),
     )
-    await storage.store_primitive(
-        primitive_id="cap-1",
-        primitive_type="capability",
-        scope_id=scope_id,
-        data=cap.model_dump(mode="json"),
-        source="test",
-        identity_id=identity_id,
-    )
-    return cap
+    return {
+        "primitive_id": "cap-1",
+        "primitive_type": "capability",
+        "scope_id": scope_id,
+        "data_json": cap.model_dump_json(),
+        "source": "test",
+        "identity_id": identity_id,
+    }
+
+
+# The canonical "scope-1 owned by id-1" graph, built once at import and
+# re-inserted with a single bulk write by the seeded_storage fixture
+_SEED_IDENTITY_ID = "id-1"
+_SEED_ROWS = [
+    _scope_row(identity_id=_SEED_IDENTITY_ID),
+    _archetype_row(identity_id=_SEED_IDENTITY_ID),
+    _domain_row(identity_id=_SEED_IDENTITY_ID),
+    _capability_row(identity_id=_SEED_IDENTITY_ID),
+]
+
+
+_SEED_MODELS: dict[str, type[BaseModel]] = {
+    "scope": Scope,
+    "archetype": Archetype,
+    "domain": Domain,
+    "capability": Capability,
+}
+
+
+@pytest.mark.parametrize("row", _SEED_ROWS, ids=lambda row: row["primitive_type"])
+def test_seed_row_validates(row: dict) -> None:
+    """The seed rows skip validation when built, so check they still validate."""
+    model = _SEED_MODELS[row["primitive_type"]].model_validate_json(row["data_json"])
+    assert model.id == row["primitive_id"]
 
 
-@pytest.mark.asyncio
-async def test_build_declaration_from_storage(storage: StorageEngine) -> None:
-    identity_id = "id-1"
+@pytest_asyncio.fixture
+async def seeded_storage(storage: StorageEngine) -> StorageEngine:
+    """Storage holding the seed identity and its scope, archetype, domain and capability."""
     await storage.upsert_identity(
-        identity_id=identity_id, email="test@example.com", display_name="Test"
+        identity_id=_SEED_IDENTITY_ID, email="test@example.com", display_name="Test"
     )
+    await storage.store_primitives_bulk(_SEED_ROWS)
+    return storage
 
-    await _store_scope(storage, identity_id=identity_id)
-    await _store_archetype(storage, identity_id=identity_id)
-    await _store_domain(storage, identity_id=identity_id)
-    await _store_capability(storage, identity_id=identity_id)
 
-    declaration = await build_declaration_from_storage(storage, "scope-1")
+@pytest.mark.asyncio
+async def test_build_declaration_from_storage(seeded_storage: StorageEngine) -> None:
+    declaration = await build_declaration_from_storage(seeded_storage, "scope-1")
 
     assert declaration is not None
     assert declaration.scope.id == "scope-1"
@@ -170,51 +191,32 @@ async def test_build_declaration_nonexistent_scope(storage: StorageEngine) -> No
 
 
 @pytest.mark.asyncio
-async def test_build_declaration_with_provenance(storage: StorageEngine) -> None:
-    identity_id = "id-1"
-    await storage.upsert_identity(
-        identity_id=identity_id, email="test@example.com", display_name="Test"
-    )
-    await _store_scope(storage, identity_id=identity_id)
-
-    await storage.append_provenance(
+async def test_build_declaration_with_provenance(seeded_storage: StorageEngine) -> None:
+    await seeded_storage.append_provenance(
         provenance_id="prov-1",
         scope_id="scope-1",
         primitive_id="scope-1",
         primitive_type="scope",
         action="structured",
-        actor_identity_id=identity_id,
+        actor_identity_id=_SEED_IDENTITY_ID,
         details={"action": "structured"},
     )
 
-    declaration = await build_declaration_from_storage(storage, "scope-1")
+    declaration = await build_declaration_from_storage(seeded_storage, "scope-1")
     assert declaration is not None
     assert len(declaration.provenance) >= 1
 
 
 @pytest.mark.asyncio
-async def test_build_declaration_completion(storage: StorageEngine) -> None:
-    identity_id = "id-1"
-    await storage.upsert_identity(
-        identity_id=identity_id, email="test@example.com", display_name="Test"
-    )
-    await _store_scope(storage, identity_id=identity_id)
-    await _store_domain(storage, identity_id=identity_id)
-
-    declaration = await build_declaration_from_storage(storage, "scope-1")
+async def test_build_declaration_completion(seeded_storage: StorageEngine) -> None:
+    declaration = await build_declaration_from_storage(seeded_storage, "scope-1")
     assert declaration is not None
     assert declaration.completion_percentage == 0.0  # Nothing confirmed
 
 
 @pytest.mark.asyncio
-async def test_find_scope_for_identity(storage: StorageEngine) -> None:
-    identity_id = "id-1"
-    await storage.upsert_identity(
-        identity_id=identity_id, email="test@example.com", display_name="Test"
-    )
-    await _store_scope(storage, identity_id=identity_id)
-
-    scope_id = await find_scope_for_identity(storage, "test@example.com")
+async def test_find_scope_for_identity(seeded_storage: StorageEngine) -> None:
+    scope_id = await find_scope_for_identity(seeded_storage, "test@example.com")
     assert scope_id == "scope-1"
 
 
@@ -243,3 +245,99 @@ async def test_find_scope_from_non_scope_primitive(storage: StorageEngine) -> No
 
     scope_id = await find_scope_for_identity(storage, "test@example.com")
     assert scope_id == "scope-abc"
+
+
+@pytest.mark.asyncio
+async def test_persist_structured_primitives_round_trip(storage: StorageEngine) -> None:
+    """Primitives persisted by the pipeline read back unchanged, non-ASCII text included."""
+    await storage.upsert_identity(
+        identity_id="id-1", email="test@example.com", display_name="Test User"
+    )
+    await storage.create_extraction(
+        extraction_id="ext-1", source_type="test", source_identifier="test"
+    )
+    scope = Scope(
+        id="scope-1",
+        name="Intake → Dispatch",
+        description="Freight intake handed to dispatch",
+        owner_identity=_identity(),
+        source=_source(),
+    )
+    structured = StructuredPrimitives(
+        scope_id="scope-1",
+        archetypes=[
+            Archetype(
+                id="arch-1",
+                scope_id="scope-1",
+                identity=_identity(),
+                role_name="Dispatcher",
+                role_description="Routes loads — « urgent » first",
+                primary_responsibilities=["Route loads"],
+                decision_authority=["Assign carriers"],
+                accountability_boundaries=["Does not set pricing"],
+                source=_source(),
+            )
+        ],
+        domains=[
+            Domain(
+                id="dom-1",
+                scope_id="scope-1",
+                name="Dispatch",
+                description="Load assignment",
+                outcome_definition="Every load has a carrier",
+                accountable_archetype_id="arch-1",
+                source=_source(),
+            )
+        ],
+        capabilities=[
+            Capability(
+                id="cap-1",
+                scope_id="scope-1",
+                domain_id="dom-1",
+                name="Intake → Dispatch handoff",
+                description="Hand a qualified load to dispatch",
+                outcome="Load assigned",
+                decision_factors=[DecisionFactor(name="Größe", description="Load size")],
+                heuristics=["Oversized loads → specialist carriers"],
+                anti_patterns=[],
+                exceptions=[],
+                skills=[],
+                source=_source(),
+            )
+        ],
+        policies=[],
+        connectors=[],
+        bindings=[
+            Binding(
+                id="bind-1",
+                scope_id="scope-1",
+                name="Intake → Dispatch",
+                writes_to="Dispatch Team",
+                writes_to_type="external_system",
+                governed_by_policy_ids=[],
+                description="Qualified loads",
+                source=_source(),
+            )
+        ],
+    )
+
+    await persist_structured_primitives(
+        storage, structured, scope, "ext-1", "id-1", source_label="test"
+    )
+    declaration = await build_declaration_from_storage(storage, "scope-1")
+
+    assert declaration is not None
+    assert declaration.scope == scope
+    assert declaration.archetypes == structured.archetypes
+    assert declaration.domains == structured.domains
+    assert declaration.capabilities == structured.capabilities
+    assert declaration.bindings == structured.bindings
+    assert len(declaration.provenance) == 5
+    assert {(p.primitive_id, p.primitive_type, p.action) for p in declaration.provenance} == {
+        ("scope-1", "scope", "structured"),
+        ("arch-1", "archetype", "structured"),
+        ("dom-1", "domain", "structured"),
+        ("cap-1", "capability", "structured"),
+        ("bind-1", "binding", "structured"),
+    }
+    assert all(p.actor == _identity() for p in declaration.provenance)
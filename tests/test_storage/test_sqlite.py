@@ -1,36 +1,30 @@
 """Tests for SQLite storage layer."""
 
+import asyncio
 import json
-from pathlib import Path
 
 import pytest
-import pytest_asyncio
 
 from tml_engine.storage.sqlite import StorageEngine
 
 
-@pytest_asyncio.fixture
-async def storage(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-    engine = StorageEngine(db_path)
-    await engine.initialize()
-    yield engine
-    await engine.close()
-
-
 @pytest.mark.asyncio
 async def test_initialize_creates_tables(storage: StorageEngine) -> None:
+    tables = (
+        "identities",
+        "primitives",
+        "provenance",
+        "declarations",
+        "extractions",
+        "interview_sessions",
+    )
+    placeholders = ", ".join("?" * len(tables))
     cursor = await storage.db.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+        tables,
     )
-    rows = await cursor.fetchall()
-    table_names = {row[0] for row in rows}
-    assert "identities" in table_names
-    assert "primitives" in table_names
-    assert "provenance" in table_names
-    assert "declarations" in table_names
-    assert "extractions" in table_names
-    assert "interview_sessions" in table_names
+    (count,) = await cursor.fetchone()
+    assert count == len(tables)
 
 
 @pytest.mark.asyncio
@@ -73,15 +67,46 @@ async def test_store_and_get_primitive(storage: StorageEngine) -> None:
 
 
 @pytest.mark.asyncio
-async def test_list_primitives_by_type(storage: StorageEngine) -> None:
-    await storage.store_primitive(
-        primitive_id="s1", primitive_type="scope", scope_id=None, data={}, source="test"
-    )
-    await storage.store_primitive(
-        primitive_id="d1", primitive_type="domain", scope_id="s1", data={}, source="test"
+async def test_store_primitive_raw(storage: StorageEngine) -> None:
+    data_json = '{"name":"Test Scope"}'
+    await storage.store_primitive_raw(
+        primitive_id="scope-1",
+        primitive_type="scope",
+        scope_id=None,
+        data_json=data_json,
+        source="test",
     )
-    await storage.store_primitive(
-        primitive_id="d2", primitive_type="domain", scope_id="s1", data={}, source="test"
+    result = await storage.get_primitive("scope-1")
+    assert result is not None
+    assert result["data"] == data_json
+
+
+@pytest.mark.asyncio
+async def test_list_primitives_by_type(storage: StorageEngine) -> None:
+    await storage.store_primitives_bulk(
+        [
+            {
+                "primitive_id": "s1",
+                "primitive_type": "scope",
+                "scope_id": None,
+                "data_json": "{}",
+                "source": "test",
+            },
+            {
+                "primitive_id": "d1",
+                "primitive_type": "domain",
+                "scope_id": "s1",
+                "data_json": "{}",
+                "source": "test",
+            },
+            {
+                "primitive_id": "d2",
+                "primitive_type": "domain",
+                "scope_id": "s1",
+                "data_json": "{}",
+                "source": "test",
+            },
+        ]
     )
     domains = await storage.list_primitives(primitive_type="domain")
     assert len(domains) == 2
@@ -89,6 +114,38 @@ async def test_list_primitives_by_type(storage: StorageEngine) -> None:
     assert len(scopes) == 1
 
 
+@pytest.mark.parametrize(
+    "row",
+    [
+        pytest.param(
+            {"primitive_id": "s1", "primitive_type": "scope", "scope_id": None, "source": "test"},
+            id="missing_data_json",
+        ),
+        pytest.param(
+            {
+                "primitive_id": "s1",
+                "primitive_type": "scope",
+                "scope_id": None,
+                "data": {},
+                "data_json": "{}",
+                "source": "test",
+            },
+            id="data_and_data_json",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_store_primitives_bulk_rejects_invalid_rows(
+    storage: StorageEngine, row: dict
+) -> None:
+    valid = {**row, "primitive_id": "s0", "data_json": "{}"}
+    valid.pop("data", None)
+    with pytest.raises(ValueError, match="Invalid primitive row 's1'"):
+        await storage.store_primitives_bulk([valid, row])
+    # Rows are checked before the write, so the valid row is not stored either
+    assert await storage.list_primitives() == []
+
+
 @pytest.mark.asyncio
 async def test_update_confirmation(storage: StorageEngine) -> None:
     await storage.store_primitive(
@@ -172,10 +229,13 @@ async def test_interview_session_lifecycle(storage: StorageEngine) -> None:
 
 @pytest.mark.asyncio
 async def test_get_nonexistent_returns_none(storage: StorageEngine) -> None:
-    assert await storage.get_identity("nope") is None
-    assert await storage.get_primitive("nope") is None
-    assert await storage.get_declaration("nope") is None
-    assert await storage.get_interview_session("nope") is None
+    results = await asyncio.gather(
+        storage.get_identity("nope"),
+        storage.get_primitive("nope"),
+        storage.get_declaration("nope"),
+        storage.get_interview_session("nope"),
+    )
+    assert results == [None, None, None, None]
 
 
 @pytest.mark.asyncio
@@ -197,31 +257,49 @@ async def test_get_identity_by_email_not_found(storage: StorageEngine) -> None:
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_identities_by_emails(storage: StorageEngine) -> None:
+    for i in range(3):
+        await storage.upsert_identity(
+            identity_id=f"id-{i}", email=f"user{i}@example.com", display_name=f"User {i}"
+        )
+    # More emails than fit in one IN (...) chunk, including unknowns and duplicates
+    emails = [f"nobody{i}@example.com" for i in range(1000)]
+    emails += ["user0@example.com", "user2@example.com", "user0@example.com"]
+    result = await storage.get_identities_by_emails(emails)
+    assert set(result) == {"user0@example.com", "user2@example.com"}
+    assert result["user2@example.com"]["id"] == "id-2"
+
+
 @pytest.mark.asyncio
 async def test_list_primitives_by_identity(storage: StorageEngine) -> None:
-    await storage.store_primitive(
-        primitive_id="s1",
-        primitive_type="scope",
-        scope_id=None,
-        data={},
-        source="test",
-        identity_id="id-1",
-    )
-    await storage.store_primitive(
-        primitive_id="d1",
-        primitive_type="domain",
-        scope_id="s1",
-        data={},
-        source="test",
-        identity_id="id-1",
-    )
-    await storage.store_primitive(
-        primitive_id="d2",
-        primitive_type="domain",
-        scope_id="s1",
-        data={},
-        source="test",
-        identity_id="id-2",
+    await storage.store_primitives_bulk(
+        [
+            {
+                "primitive_id": "s1",
+                "primitive_type": "scope",
+                "scope_id": None,
+                "data_json": "{}",
+                "source": "test",
+                "identity_id": "id-1",
+            },
+            {
+                "primitive_id": "d1",
+                "primitive_type": "domain",
+                "scope_id": "s1",
+                "data_json": "{}",
+                "source": "test",
+                "identity_id": "id-1",
+            },
+            {
+                "primitive_id": "d2",
+                "primitive_type": "domain",
+                "scope_id": "s1",
+                "data_json": "{}",
+                "source": "test",
+                "identity_id": "id-2",
+            },
+        ]
     )
 
     result = await storage.list_primitives_by_identity("id-1")
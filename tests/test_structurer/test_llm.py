@@ -6,149 +6,171 @@ without requiring an actual Claude API key.
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import pytest
 
+from tests.helpers import FROZEN_NOW
 from tml_engine.extractors.base import ContentBlock, RawExtractionResult
 from tml_engine.structurer.llm import LLMStructurer, StructuredPrimitives
 
+_BLOCK_ABOUT = ContentBlock(
+    content="We provide logistics optimization services.",
+    content_type="page",
+    context="About Us",
+    url="https://example.com/about",
+)
+_BLOCK_SERVICES = ContentBlock(
+    content="Our team evaluates carriers based on safety records.",
+    content_type="page",
+    context="Services",
+    url="https://example.com/services",
+)
 
-def _make_extraction() -> RawExtractionResult:
+
+@pytest.fixture(scope="module")
+def structurer() -> LLMStructurer:
+    """One structurer for the module; the API client is only created on first use."""
+    return LLMStructurer()
+
+
+@pytest.fixture(scope="module")
+def extraction() -> RawExtractionResult:
+    """One extraction result for the module; tests treat it as read-only."""
     return RawExtractionResult(
         source_type="web",
         source_identifier="https://example.com",
-        content_blocks=[
-            ContentBlock(
-                content="We provide logistics optimization services.",
-                content_type="page",
-                context="About Us",
-                url="https://example.com/about",
-            ),
-            ContentBlock(
-                content="Our team evaluates carriers based on safety records.",
-                content_type="page",
-                context="Services",
-                url="https://example.com/services",
-            ),
-        ],
+        content_blocks=[_BLOCK_ABOUT, _BLOCK_SERVICES],
         metadata={"pages_crawled": 2},
-        extracted_at=datetime.now(UTC),
+        extracted_at=FROZEN_NOW,
     )
 
 
-def _make_raw_llm_output() -> dict:
-    return {
-        "archetypes": [
-            {
-                "role_name": "Operations Manager",
-                "role_description": "Manages logistics operations",
-                "primary_responsibilities": ["Carrier evaluation", "Load matching"],
-                "decision_authority": ["Approve carriers"],
-                "accountability_boundaries": ["Does not set pricing"],
-                "confidence": "high",
-            }
-        ],
-        "domains": [
-            {
-                "name": "Carrier Management",
-                "description": "Managing carrier relationships",
-                "outcome_definition": "Reliable carrier network",
-                "confidence": "high",
-            }
-        ],
-        "capabilities": [
-            {
-                "name": "Carrier Safety Assessment",
-                "description": "Evaluate carrier safety",
-                "outcome": "Accept/reject decision",
-                "domain_name": "Carrier Management",
-                "decision_factors": [
-                    {"name": "Safety Score", "description": "FMCSA score", "weight": "primary"}
-                ],
-                "heuristics": ["Green scores = fast track"],
-                "anti_patterns": ["Approving on rate alone"],
-                "exceptions": [
-                    {
-                        "trigger": "Emergency load",
-                        "override_description": "Conditional approval",
-                        "reason": "Service failure risk",
-                    }
-                ],
-                "skills": [
-                    {
-                        "name": "FMCSA Lookup",
-                        "description": "Query FMCSA SAFER",
-                        "skill_type": "tool",
-                    }
-                ],
-                "confidence": "high",
-            }
-        ],
-        "policies": [
-            {
-                "name": "Safety Floor",
-                "description": "Minimum safety requirements",
-                "rule": "No carriers with unsatisfactory ratings",
-                "enforcement_level": "hard",
-                "confidence": "high",
-            }
-        ],
-        "connectors": [
-            {
-                "name": "FMCSA Data",
-                "reads_from": "FMCSA SAFER",
-                "reads_from_type": "external_system",
-                "description": "Safety data input",
-                "confidence": "medium",
-            }
-        ],
-        "bindings": [
-            {
-                "name": "Dispatch Output",
-                "writes_to": "Dispatch Team",
-                "writes_to_type": "external_system",
-                "description": "Carrier assignments",
-                "confidence": "medium",
-            }
-        ],
-    }
-
-
-class TestLLMStructurer:
-    def test_format_content(self) -> None:
-        structurer = LLMStructurer()
-        extraction = _make_extraction()
-        text = structurer._format_content(extraction)
-        assert "About Us" in text
-        assert "Services" in text
-        assert "logistics optimization" in text
-        assert "https://example.com/about" in text
+# LLM responses are only read by _build_primitives, so tests share these as-is
+_RAW_LLM_OUTPUT: dict = {
+    "archetypes": [
+        {
+            "role_name": "Operations Manager",
+            "role_description": "Manages logistics operations",
+            "primary_responsibilities": ["Carrier evaluation", "Load matching"],
+            "decision_authority": ["Approve carriers"],
+            "accountability_boundaries": ["Does not set pricing"],
+            "confidence": "high",
+        }
+    ],
+    "domains": [
+        {
+            "name": "Carrier Management",
+            "description": "Managing carrier relationships",
+            "outcome_definition": "Reliable carrier network",
+            "confidence": "high",
+        }
+    ],
+    "capabilities": [
+        {
+            "name": "Carrier Safety Assessment",
+            "description": "Evaluate carrier safety",
+            "outcome": "Accept/reject decision",
+            "domain_name": "Carrier Management",
+            "decision_factors": [
+                {"name": "Safety Score", "description": "FMCSA score", "weight": "primary"}
+            ],
+            "heuristics": ["Green scores = fast track"],
+            "anti_patterns": ["Approving on rate alone"],
+            "exceptions": [
+                {
+                    "trigger": "Emergency load",
+                    "override_description": "Conditional approval",
+                    "reason": "Service failure risk",
+                }
+            ],
+            "skills": [
+                {
+                    "name": "FMCSA Lookup",
+                    "description": "Query FMCSA SAFER",
+                    "skill_type": "tool",
+                }
+            ],
+            "confidence": "high",
+        }
+    ],
+    "policies": [
+        {
+            "name": "Safety Floor",
+            "description": "Minimum safety requirements",
+            "rule": "No carriers with unsatisfactory ratings",
+            "enforcement_level": "hard",
+            "confidence": "high",
+        }
+    ],
+    "connectors": [
+        {
+            "name": "FMCSA Data",
+            "reads_from": "FMCSA SAFER",
+            "reads_from_type": "external_system",
+            "description": "Safety data input",
+            "confidence": "medium",
+        }
+    ],
+    "bindings": [
+        {
+            "name": "Dispatch Output",
+            "writes_to": "Dispatch Team",
+            "writes_to_type": "external_system",
+            "description": "Carrier assignments",
+            "confidence": "medium",
+        }
+    ],
+}
 
-    def test_extract_json_raw(self) -> None:
-        structurer = LLMStructurer()
-        raw = '{"archetypes": [], "domains": []}'
-        result = structurer._extract_json(raw)
-        assert result == {"archetypes": [], "domains": []}
+_EMPTY_RAW: dict = {
+    "archetypes": [],
+    "domains": [],
+    "capabilities": [],
+    "policies": [],
+    "connectors": [],
+    "bindings": [],
+}
 
-    def test_extract_json_code_fence(self) -> None:
-        structurer = LLMStructurer()
-        raw = 'Here is the result:\n```json\n{"archetypes": []}\n```\nDone.'
-        result = structurer._extract_json(raw)
-        assert result == {"archetypes": []}
 
-    def test_extract_json_code_fence_no_lang(self) -> None:
-        structurer = LLMStructurer()
-        raw = '```\n{"domains": [{"name": "test"}]}\n```'
-        result = structurer._extract_json(raw)
-        assert result["domains"][0]["name"] == "test"
+class TestLLMStructurer:
+    def test_format_content(
+        self, structurer: LLMStructurer, extraction: RawExtractionResult
+    ) -> None:
+        assert structurer._format_content(extraction) == (
+            "--- [page] About Us (https://example.com/about) ---\n"
+            "We provide logistics optimization services.\n\n"
+            "--- [page] Services (https://example.com/services) ---\n"
+            "Our team evaluates carriers based on safety records."
+        )
 
-    def test_build_primitives(self) -> None:
-        structurer = LLMStructurer()
-        extraction = _make_extraction()
-        raw = _make_raw_llm_output()
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param(
+                '{"archetypes": [], "domains": []}',
+                {"archetypes": [], "domains": []},
+                id="raw",
+            ),
+            pytest.param(
+                'Here is the result:\n```json\n{"archetypes": []}\n```\nDone.',
+                {"archetypes": []},
+                id="code_fence",
+            ),
+            pytest.param(
+                '```\n{"domains": [{"name": "test"}]}\n```',
+                {"domains": [{"name": "test"}]},
+                id="code_fence_no_lang",
+            ),
+        ],
+    )
+    def test_extract_json(self, structurer: LLMStructurer, raw: str, expected: dict) -> None:
+        assert structurer._extract_json(raw) == expected
 
-        result = structurer._build_primitives(raw, "scope-001", extraction)
+    def test_build_primitives(
+        self, structurer: LLMStructurer, extraction: RawExtractionResult
+    ) -> None:
+        result = structurer._build_primitives(_RAW_LLM_OUTPUT, "scope-001", extraction)
 
-        assert isinstance(result, StructuredPrimitives)
+        assert type(result) is StructuredPrimitives
         assert result.scope_id == "scope-001"
 
         # Archetypes — now Pydantic models, not dicts
@@ -195,34 +217,23 @@ class TestLLMStructurer:
 
         # Confidence tracking
         assert len(result.confidence_map) > 0
-        arch_conf = next(c for c in result.confidence_map if c.primitive_id == arch.id)
-        assert arch_conf.confidence == "high"
-
-    def test_build_primitives_empty(self) -> None:
-        structurer = LLMStructurer()
-        extraction = _make_extraction()
-        raw = {
-            "archetypes": [],
-            "domains": [],
-            "capabilities": [],
-            "policies": [],
-            "connectors": [],
-            "bindings": [],
-        }
-
-        result = structurer._build_primitives(raw, "scope-001", extraction)
-        assert len(result.archetypes) == 0
-        assert len(result.domains) == 0
-        assert len(result.capabilities) == 0
-
-    def test_build_primitives_missing_keys(self) -> None:
-        structurer = LLMStructurer()
-        extraction = _make_extraction()
-        raw = {}  # No keys at all
+        conf_by_id = {c.primitive_id: c for c in result.confidence_map}
+        assert conf_by_id[arch.id].confidence == "high"
 
+    @pytest.mark.parametrize(
+        "raw",
+        [pytest.param(_EMPTY_RAW, id="empty"), pytest.param({}, id="missing_keys")],
+    )
+    def test_build_primitives_no_data(
+        self, structurer: LLMStructurer, extraction: RawExtractionResult, raw: dict
+    ) -> None:
         result = structurer._build_primitives(raw, "scope-001", extraction)
-        assert len(result.archetypes) == 0
-        assert len(result.domains) == 0
+        assert result.archetypes == []
+        assert result.domains == []
+        assert result.capabilities == []
+        assert result.policies == []
+        assert result.connectors == []
+        assert result.bindings == []
 
     def test_structured_primitives_model(self) -> None:
         """Test StructuredPrimitives can be created with empty lists."""
@@ -237,8 +248,7 @@ class TestLLMStructurer:
         )
         assert sp.scope_id == "scope-001"
         assert len(sp.archetypes) == 0
-        data = sp.model_dump()
-        assert data["scope_id"] == "scope-001"
+        assert sp.model_dump(include={"scope_id"}) == {"scope_id": "scope-001"}
 
     def test_structured_primitives_with_confidence_map(self) -> None:
         from tml_engine.structurer.llm import PrimitiveWithConfidence